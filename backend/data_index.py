@@ -0,0 +1,112 @@
+"""Per-dataset statistics index.
+
+Summaries are computed once per CSV and reused until the file changes
+(tracked by mtime and size), so previews never need a full data load.
+"""
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+
+HISTOGRAM_BINS = 20
+OVERVIEW_POINTS = 150  # Downsampled series length for overview charts
+SAMPLE_ROWS = 10
+
+_summaries: dict[str, tuple[tuple[int, int], dict]] = {}
+_cities: tuple[int, list[str]] | None = None
+
+
+def _file_key(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _round(value: float) -> float | None:
+    return None if pd.isna(value) else round(float(value), 4)
+
+
+def _column_stats(series: pd.Series) -> dict:
+    values = series.dropna().to_numpy(dtype=np.float64)
+    stats = {
+        "min": _round(values.min()) if len(values) else None,
+        "max": _round(values.max()) if len(values) else None,
+        "mean": _round(values.mean()) if len(values) else None,
+        "nulls": int(series.isna().sum()),
+    }
+    if len(values):
+        counts, edges = np.histogram(values, bins=HISTOGRAM_BINS)
+        stats["histogram"] = {
+            "counts": counts.tolist(),
+            "edges": [round(float(e), 4) for e in edges],
+        }
+    return stats
+
+
+def _overview(df: pd.DataFrame, numeric_cols: list[str]) -> list[dict]:
+    """Bucket-average numeric columns down to about OVERVIEW_POINTS rows."""
+    bucket = max(1, -(-len(df) // OVERVIEW_POINTS))
+    groups = np.arange(len(df)) // bucket
+    means = df[numeric_cols].groupby(groups).mean()
+    starts = df["date"].groupby(groups).first()
+    overview = []
+    for g, row in means.iterrows():
+        entry = {"date": str(starts[g])[:10]}
+        entry.update({col: _round(row[col]) for col in numeric_cols})
+        overview.append(entry)
+    return overview
+
+
+def compute_summary(path: Path) -> dict:
+    """Compute the statistics summary for one CSV file."""
+    df = pd.read_csv(path)
+    df["date"] = pd.to_datetime(df["date"])
+    numeric_cols = [c for c in df.columns if c != "date" and pd.api.types.is_numeric_dtype(df[c])]
+
+    sample = df.tail(SAMPLE_ROWS).to_dict(orient="records")
+    for row in sample:
+        row["date"] = str(row["date"])
+        for k, v in row.items():
+            if isinstance(v, float) and np.isnan(v):
+                row[k] = None
+
+    return {
+        "city": path.stem,
+        "rows": len(df),
+        "columns": list(df.columns),
+        "date_range": {
+            "start": str(df["date"].min())[:10],
+            "end": str(df["date"].max())[:10],
+        },
+        "stats": {col: _column_stats(df[col]) for col in numeric_cols},
+        "overview": _overview(df, numeric_cols),
+        "sample": sample,
+    }
+
+
+def list_cities() -> list[str]:
+    """City names available in DATA_DIR, re-globbed only when the directory changes."""
+    global _cities
+    mtime = DATA_DIR.stat().st_mtime_ns
+    if _cities is None or _cities[0] != mtime:
+        _cities = (mtime, [f.stem for f in sorted(DATA_DIR.glob("*.csv"))])
+    return _cities[1]
+
+
+def get_summary(city: str) -> dict:
+    """Return the cached summary for a city, recomputing if its file changed."""
+    path = DATA_DIR / f"{city}.csv"
+    if city not in list_cities() or not path.exists():
+        raise FileNotFoundError(f"No data for city: {city}")
+    key = _file_key(path)
+    cached = _summaries.get(city)
+    if cached is None or cached[0] != key:
+        cached = (key, compute_summary(path))
+        _summaries[city] = cached
+    return cached[1]
+
+
+def build_index() -> None:
+    """Compute summaries for every dataset up front."""
+    for city in list_cities():
+        get_summary(city)
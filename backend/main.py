@@ -1,7 +1,10 @@
 """FastAPI backend for Weather ML Pipeline."""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from .data_index import build_index
+from .ml.governor import TORCH_THREADS_PER_RUN
 from .ml.registry import discover_nodes, get_all_metadata
+from .ml.reproducibility import configure_torch
 from .routers import pipeline, data
 
 app = FastAPI(title="Weather ML Pipeline")
@@ -16,6 +19,12 @@ app.add_middleware(
 # Discover all ML nodes on startup
 discover_nodes()
 
+# Fixed torch threading for every run, so seeded runs reproduce without serializing
+configure_torch(TORCH_THREADS_PER_RUN)
+
+# Precompute dataset statistics so previews never load raw CSVs
+build_index()
+
 app.include_router(pipeline.router)
 app.include_router(data.router)
 
@@ -23,7 +23,11 @@ class MLNode(ABC):
 
     @property
     def input_ports(self) -> list[dict]:
-        """List of input port definitions: [{name, datatype}]."""
+        """List of input port definitions: [{name, datatype, multiple?}].
+
+        A port with multiple=True accepts several edges; execute() then receives
+        a dict of {source_node_id: value} for it.
+        """
         return []
 
     @property
@@ -38,6 +42,14 @@ class MLNode(ABC):
         """
         return []
 
+    def estimate_cost(self, inputs: dict[str, Any], params: dict[str, Any]) -> float:
+        """Rough estimate of execute() wall-clock time in seconds, used for admission control."""
+        return 0.0
+
+    def estimate_memory(self, inputs: dict[str, Any], params: dict[str, Any]) -> float:
+        """Rough estimate of execute() working memory in MB, used for admission control."""
+        return 0.0
+
     @abstractmethod
     def execute(self, inputs: dict[str, Any], params: dict[str, Any]) -> dict[str, Any]:
         """Run this node. Returns dict keyed by output port names."""
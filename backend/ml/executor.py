@@ -1,7 +1,9 @@
 """Pipeline executor: topological sort and run."""
 from collections import defaultdict, deque
 from typing import Any
+from .governor import RunBudget, budget_scope, checkpoint
 from .registry import get_node_class
+from .reproducibility import fingerprint
 
 
 def topological_sort(nodes: list[dict], edges: list[dict]) -> list[str]:
@@ -49,10 +51,22 @@ def get_upstream_nodes(target_id: str, nodes: list[dict], edges: list[dict]) ->
     return needed
 
 
-def run_pipeline(pipeline: dict, target_node: str | None = None) -> dict[str, Any]:
+def run_pipeline(
+    pipeline: dict,
+    target_node: str | None = None,
+    seed: int | None = None,
+    budget: RunBudget | None = None,
+) -> dict[str, Any]:
     """Execute a pipeline graph and return results per node.
 
     If target_node is specified, only run that node and its upstream dependencies.
+    If seed is specified, run in reproducible mode: the seed is passed to every
+    node as params["seed"] and each node's result carries a fingerprint of its
+    outputs. Torch threading is fixed process-wide by configure_torch().
+    If budget is specified, each node is admitted only if its estimated time and
+    memory fit what the run has left, node outputs count against the memory
+    budget, and the run is cancelled with BudgetExceeded at the next checkpoint
+    once it goes over its time limit.
     """
     nodes = pipeline["nodes"]
     edges = pipeline["edges"]
@@ -69,33 +83,55 @@ def run_pipeline(pipeline: dict, target_node: str | None = None) -> dict[str, An
     outputs: dict[str, dict[str, Any]] = {}
     results: dict[str, Any] = {}
 
-    for nid in order:
-        node_def = node_map[nid]
-        node_cls = get_node_class(node_def["type"])
-        node_instance = node_cls()
-
-        # Gather inputs from upstream edges
-        inputs: dict[str, Any] = {}
-        for edge in edges:
-            if edge["target"] == nid:
-                src_id = edge["source"]
-                src_handle = edge.get("sourceHandle", "output")
-                tgt_handle = edge.get("targetHandle", "input")
-                if src_id in outputs and src_handle in outputs[src_id]:
-                    inputs[tgt_handle] = outputs[src_id][src_handle]
-
-        params = node_def.get("params", {})
-        node_outputs = node_instance.execute(inputs, params)
-        outputs[nid] = node_outputs
-
-        # Collect user-facing results (metrics, previews, etc.)
-        if "metrics" in node_outputs:
-            results[nid] = {
-                "node_type": node_def["type"],
-                "metrics": node_outputs["metrics"],
-            }
-        if "preview" in node_outputs:
-            results.setdefault(nid, {})["preview"] = node_outputs["preview"]
-            results[nid]["node_type"] = node_def["type"]
+    if budget is not None:
+        budget.start()
+    with budget_scope(budget):
+        for nid in order:
+            node_def = node_map[nid]
+            node_cls = get_node_class(node_def["type"])
+            node_instance = node_cls()
+
+            # Gather inputs from upstream edges. Ports marked "multiple" accept
+            # several edges and receive {source_id: value} instead of one value.
+            multi_ports = {p["name"] for p in node_instance.input_ports if p.get("multiple")}
+            inputs: dict[str, Any] = {}
+            for edge in edges:
+                if edge["target"] == nid:
+                    src_id = edge["source"]
+                    src_handle = edge.get("sourceHandle", "output")
+                    tgt_handle = edge.get("targetHandle", "input")
+                    if src_id in outputs and src_handle in outputs[src_id]:
+                        value = outputs[src_id][src_handle]
+                        if tgt_handle in multi_ports:
+                            inputs.setdefault(tgt_handle, {})[src_id] = value
+                        else:
+                            inputs[tgt_handle] = value
+
+            params = node_def.get("params", {})
+            if seed is not None:
+                params = {**params, "seed": seed}
+            if budget is not None:
+                budget.admit(
+                    f"{nid} ({node_def['type']})",
+                    node_instance.estimate_cost(inputs, params),
+                    node_instance.estimate_memory(inputs, params),
+                )
+            node_outputs = node_instance.execute(inputs, params)
+            checkpoint()
+            if budget is not None:
+                budget.hold(node_outputs)
+            outputs[nid] = node_outputs
+
+            # Collect user-facing results (metrics, previews, etc.)
+            if "metrics" in node_outputs:
+                results[nid] = {
+                    "node_type": node_def["type"],
+                    "metrics": node_outputs["metrics"],
+                }
+            if "preview" in node_outputs:
+                results.setdefault(nid, {})["preview"] = node_outputs["preview"]
+                results[nid]["node_type"] = node_def["type"]
+            if seed is not None:
+                results.setdefault(nid, {"node_type": node_def["type"]})["fingerprint"] = fingerprint(node_outputs)
 
     return results
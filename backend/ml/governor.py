@@ -0,0 +1,221 @@
+"""Per-run resource budgets, cooperative cancellation and fair run scheduling."""
+import asyncio
+import os
+import time
+from collections import OrderedDict, defaultdict, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+
+# Default per-run limits
+RUN_TIME_BUDGET_S = 120.0
+RUN_MEMORY_BUDGET_MB = 2048.0
+
+# Concurrent pipeline runs across all users; further runs wait in the queue
+MAX_CONCURRENT_RUNS = max(1, (os.cpu_count() or 2) // 2)
+# Torch intra-op threads, sized so concurrent runs together fill the CPUs
+TORCH_THREADS_PER_RUN = max(1, (os.cpu_count() or 2) // MAX_CONCURRENT_RUNS)
+MAX_QUEUED_PER_USER = 3
+# Bounds what one address can queue by rotating session IDs
+MAX_QUEUED_PER_ADDRESS = 12
+
+# Proxies whose X-Forwarded-For is trusted, e.g. the Vite dev server (xfwd: true),
+# and how many of them sit in front of the backend. Each trusted proxy appends
+# the peer it saw, so the real client is that many entries from the right;
+# anything further left was supplied by the client and can be forged.
+TRUSTED_PROXIES = {"127.0.0.1", "::1"}
+TRUSTED_PROXY_HOPS = 1
+
+
+class BudgetExceeded(RuntimeError):
+    """Raised when a run would exceed, or has exceeded, its resource budget."""
+
+
+class QueueFull(RuntimeError):
+    """Raised when a user already has too many runs waiting."""
+
+
+def nbytes(obj, seen: dict[int, object] | None = None) -> int:
+    """Approximate bytes held by a node output, counting shared objects once via seen.
+
+    seen maps id -> object and keeps the objects referenced, so ids can't be
+    reused by new objects while seen is alive.
+    """
+    seen = {} if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen[id(obj)] = obj
+    if isinstance(obj, dict):
+        return sum(nbytes(v, seen) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(nbytes(v, seen) for v in obj)
+    if hasattr(obj, "memory_usage"):  # DataFrame
+        return int(obj.memory_usage(deep=True).sum())
+    if hasattr(obj, "nbytes"):  # ndarray, tensor
+        return int(obj.nbytes)
+    if hasattr(obj, "parameters"):  # nn.Module
+        return sum(nbytes(p, seen) for p in obj.parameters())
+    return 0
+
+
+def client_identity(headers, client_host: str | None) -> tuple[str, str]:
+    """Return (user, address) used to schedule a request fairly.
+
+    address is the X-Forwarded-For entry added by the trusted proxy chain when
+    the request came through one, else the peer address. user is the X-Session-Id the
+    frontend generates per tab, scoped to the address, or the address alone.
+    The session header is advisory, not authentication: a client can rotate
+    it, which is why queued runs are also capped per address.
+    """
+    address = client_host or "unknown"
+    forwarded = headers.get("x-forwarded-for")
+    if forwarded and address in TRUSTED_PROXIES:
+        hops = [hop.strip() for hop in forwarded.split(",")]
+        if len(hops) >= TRUSTED_PROXY_HOPS:
+            address = hops[-TRUSTED_PROXY_HOPS]
+    session = headers.get("x-session-id")
+    return (f"{address}/{session}" if session else address), address
+
+
+class RunBudget:
+    """Wall-clock and memory limits for one pipeline run.
+
+    Memory is accounted per run rather than measured from the process, so
+    concurrent runs don't count against each other: the run holds the bytes
+    of every node output so far, and a node is admitted only if its estimated
+    working memory fits on top of that.
+    """
+
+    def __init__(self, time_s: float = RUN_TIME_BUDGET_S, memory_mb: float = RUN_MEMORY_BUDGET_MB):
+        self.time_s = time_s
+        self.memory_mb = memory_mb
+        self.held_mb = 0.0
+        self._start = time.monotonic()
+        self._seen: dict[int, object] = {}
+
+    def start(self) -> None:
+        """(Re)start the clock, so time spent waiting before execution isn't charged."""
+        self._start = time.monotonic()
+
+    def remaining_s(self) -> float:
+        return self.time_s - (time.monotonic() - self._start)
+
+    def admit(self, label: str, estimated_s: float, estimated_mb: float = 0.0) -> None:
+        """Refuse to start work whose estimated cost exceeds what the run has left."""
+        remaining = self.remaining_s()
+        if estimated_s > remaining:
+            raise BudgetExceeded(
+                f"{label}: estimated {estimated_s:.0f}s exceeds remaining run budget of {max(remaining, 0):.0f}s"
+            )
+        if self.held_mb + estimated_mb > self.memory_mb:
+            raise BudgetExceeded(
+                f"{label}: estimated {estimated_mb:.0f}MB on top of {self.held_mb:.0f}MB held "
+                f"exceeds the {self.memory_mb:.0f}MB run memory budget"
+            )
+
+    def hold(self, outputs) -> None:
+        """Account for a node's outputs, which the run keeps until it finishes."""
+        self.held_mb += nbytes(outputs, self._seen) / 2**20
+        if self.held_mb > self.memory_mb:
+            raise BudgetExceeded(
+                f"Run holds {self.held_mb:.0f}MB of outputs, over its {self.memory_mb:.0f}MB memory budget"
+            )
+
+    def check(self) -> None:
+        if self.remaining_s() < 0:
+            raise BudgetExceeded(f"Run exceeded its {self.time_s:.0f}s time budget")
+
+
+_current_budget: ContextVar[RunBudget | None] = ContextVar("current_budget", default=None)
+
+
+@contextmanager
+def budget_scope(budget: RunBudget | None):
+    """Make budget the active budget for checkpoint() calls in this context."""
+    token = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(token)
+
+
+def checkpoint() -> None:
+    """Cooperative cancellation point: raises BudgetExceeded if the active run is over budget.
+
+    Nodes call this between epochs, boosting rounds, etc. It is a no-op outside a budgeted run.
+    """
+    budget = _current_budget.get()
+    if budget is not None:
+        budget.check()
+
+
+class FairScheduler:
+    """Limits concurrent runs and hands free slots to waiting users round-robin.
+
+    A user submitting many runs only gets one slot per rotation, so a single
+    heavy user can't starve everyone else.
+    """
+
+    def __init__(
+        self,
+        slots: int = MAX_CONCURRENT_RUNS,
+        max_queued: int = MAX_QUEUED_PER_USER,
+        max_queued_per_address: int = MAX_QUEUED_PER_ADDRESS,
+    ):
+        self._slots = slots
+        self._max_queued = max_queued
+        self._max_queued_per_address = max_queued_per_address
+        self._running = 0
+        self._queues: OrderedDict[str, deque[asyncio.Future]] = OrderedDict()
+        self._queued_by_address: defaultdict[str, int] = defaultdict(int)
+
+    async def _acquire(self, user: str, address: str | None = None) -> None:
+        if self._running < self._slots and not self._queues:
+            self._running += 1
+            return
+        if len(self._queues.get(user, ())) >= self._max_queued:
+            raise QueueFull(f"Too many queued runs for {user}; wait for earlier runs to finish")
+        address = address or user
+        if self._queued_by_address[address] >= self._max_queued_per_address:
+            raise QueueFull(f"Too many queued runs from {address}; wait for earlier runs to finish")
+        queue = self._queues.setdefault(user, deque())
+        waiter = asyncio.get_running_loop().create_future()
+        queue.append(waiter)
+        self._queued_by_address[address] += 1
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed to us as we were cancelled; pass it on
+                self._release()
+            else:
+                # _release may already have popped and skipped this waiter, and
+                # the user may have re-queued under a fresh deque since
+                if waiter in queue:
+                    queue.remove(waiter)
+                if not queue and self._queues.get(user) is queue:
+                    del self._queues[user]
+            raise
+        finally:
+            self._queued_by_address[address] -= 1
+            if not self._queued_by_address[address]:
+                del self._queued_by_address[address]
+
+    def _release(self) -> None:
+        while self._queues:
+            user, queue = self._queues.popitem(last=False)
+            waiter = queue.popleft()
+            if queue:
+                # Move this user to the back of the rotation
+                self._queues[user] = queue
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._running -= 1
+
+    @asynccontextmanager
+    async def slot(self, user: str, address: str | None = None):
+        await self._acquire(user, address)
+        try:
+            yield
+        finally:
+            self._release()
@@ -0,0 +1,134 @@
+"""Anomaly detection node: flags days with high autoencoder reconstruction error."""
+import numpy as np
+import pandas as pd
+from typing import Any
+from ..base import MLNode
+from ..registry import register
+from ...data_index import DATA_DIR, list_cities
+from .autoencoder import reconstruction_errors
+from .preprocess import build_features
+
+MAX_FLAGGED = 50  # Limit flagged days returned to the frontend
+
+
+def flag_anomalies(errors: np.ndarray, dates, threshold: float, city: str | None = None) -> list[dict]:
+    """Return entries for days whose error exceeds threshold, highest score first."""
+    flagged = []
+    for i in np.flatnonzero(errors > threshold):
+        entry = {"score": round(float(errors[i]), 6)}
+        entry["date"] = str(dates[i])[:10] if dates is not None else int(i)
+        if city is not None:
+            entry["city"] = city
+        flagged.append(entry)
+    flagged.sort(key=lambda e: e["score"], reverse=True)
+    return flagged
+
+
+def score_all_cities(model, scaler, fill_method: str, lag_days: int) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """Score the full history of every city in one batched pass.
+
+    Returns {city: (dates, errors)}.
+    """
+    cities, frames = [], []
+    for city in list_cities():
+        df = pd.read_csv(DATA_DIR / f"{city}.csv")
+        df["date"] = pd.to_datetime(df["date"])
+        df, feature_cols = build_features(df, fill_method, lag_days)
+        cities.append(city)
+        frames.append(df)
+
+    features = np.concatenate([df[feature_cols].values for df in frames]).astype(np.float32)
+    if scaler is not None:
+        features = scaler.transform(features).astype(np.float32)
+    errors = reconstruction_errors(model, features)
+
+    scored = {}
+    offset = 0
+    for city, df in zip(cities, frames):
+        scored[city] = (df["date"].values, errors[offset:offset + len(df)])
+        offset += len(df)
+    return scored
+
+
+@register
+class AnomalyDetectionNode(MLNode):
+    node_type = "anomaly_detection"
+    display_name = "Anomaly Detection"
+    category = "model"
+
+    @property
+    def input_ports(self):
+        return [{"name": "input", "datatype": "encoded"}]
+
+    @property
+    def output_ports(self):
+        return [{"name": "output", "datatype": "anomalies"}]
+
+    @property
+    def parameter_schema(self):
+        return [
+            {
+                "name": "threshold_quantile",
+                "type": "slider",
+                "default": 0.99,
+                "min": 0.9,
+                "max": 0.999,
+                "step": 0.001,
+            },
+            {
+                "name": "scope",
+                "type": "select",
+                "default": "test_set",
+                "options": ["test_set", "all_cities"],
+            },
+        ]
+
+    def estimate_memory(self, inputs: dict[str, Any], params: dict[str, Any]) -> float:
+        if params.get("scope", "test_set") != "all_cities":
+            return 0.0
+        # Parsed frames with lag features plus the concatenated feature matrix
+        csv_bytes = sum((DATA_DIR / f"{city}.csv").stat().st_size for city in list_cities())
+        return 6 * csv_bytes / 2**20
+
+    def execute(self, inputs: dict[str, Any], params: dict[str, Any]) -> dict[str, Any]:
+        data = inputs.get("input", {})
+        if "model" not in data:
+            raise ValueError("Anomaly detection requires an Autoencoder upstream")
+        train_errors = data["train_errors"]
+        test_errors = data["test_errors"]
+
+        quantile = float(params.get("threshold_quantile", 0.99))
+        scope = params.get("scope", "test_set")
+
+        # Threshold is fit on the train distribution only
+        threshold = float(np.quantile(train_errors, quantile))
+
+        metrics = {
+            "anomaly_threshold": round(threshold, 6),
+            "train_anomalies": int((train_errors > threshold).sum()),
+            "test_anomalies": int((test_errors > threshold).sum()),
+        }
+
+        if scope == "all_cities":
+            scored = score_all_cities(
+                data["model"], data.get("scaler"), data.get("fill_method", "interpolate"),
+                int(data.get("lag_days") or 0),
+            )
+            flagged = []
+            city_counts = {}
+            for city, (dates, errors) in scored.items():
+                city_flagged = flag_anomalies(errors, dates, threshold, city=city)
+                city_counts[city] = len(city_flagged)
+                flagged.extend(city_flagged)
+            flagged.sort(key=lambda e: e["score"], reverse=True)
+            metrics["city_anomaly_counts"] = city_counts
+            output = {"cities": {city: {"dates": dates, "scores": errors} for city, (dates, errors) in scored.items()}}
+        else:
+            flagged = flag_anomalies(test_errors, data.get("test_dates"), threshold)
+            output = {"dates": data.get("test_dates"), "scores": test_errors}
+
+        metrics["anomalies"] = flagged[:MAX_FLAGGED]
+        return {
+            "output": {**output, "threshold": threshold},
+            "metrics": metrics,
+        }
@@ -1,12 +1,18 @@
 """Autoencoder node: PyTorch-based dimensionality reduction."""
+import math
 import numpy as np
 import torch
 import torch.nn as nn
 from torch.utils.data import DataLoader, TensorDataset
 from typing import Any
 from ..base import MLNode
+from ..governor import checkpoint
 from ..registry import register
 
+# Cost model constants for estimate_cost (single CPU core)
+FLOPS_PER_S = 1e9
+BATCH_OVERHEAD_S = 3e-4
+
 
 class Autoencoder(nn.Module):
     def __init__(self, input_dim: int, latent_dim: int):
@@ -24,12 +30,37 @@ class Autoencoder(nn.Module):
             nn.Linear(mid, input_dim),
         )
 
+    def reset_parameters(self, generator: torch.Generator) -> None:
+        """Re-initialize weights from generator, using nn.Linear's default scheme.
+
+        Drawing from an explicit generator instead of the global RNG keeps
+        seeded runs reproducible while other runs execute concurrently.
+        """
+        with torch.no_grad():
+            for layer in self.modules():
+                if isinstance(layer, nn.Linear):
+                    nn.init.kaiming_uniform_(layer.weight, a=math.sqrt(5), generator=generator)
+                    bound = 1 / math.sqrt(layer.in_features)
+                    nn.init.uniform_(layer.bias, -bound, bound, generator=generator)
+
     def forward(self, x):
         z = self.encoder(x)
         reconstructed = self.decoder(z)
         return reconstructed, z
 
 
+def reconstruction_errors(model: Autoencoder, features: np.ndarray, batch_size: int = 4096) -> np.ndarray:
+    """Per-sample reconstruction MSE, computed in batched inference."""
+    model.eval()
+    errors = np.empty(len(features), dtype=np.float32)
+    with torch.no_grad():
+        for start in range(0, len(features), batch_size):
+            batch = torch.as_tensor(features[start:start + batch_size], dtype=torch.float32)
+            reconstructed, _ = model(batch)
+            errors[start:start + batch_size] = ((reconstructed - batch) ** 2).mean(dim=1).numpy()
+    return errors
+
+
 @register
 class AutoencoderNode(MLNode):
     node_type = "autoencoder"
@@ -81,6 +112,22 @@ class AutoencoderNode(MLNode):
             },
         ]
 
+    def estimate_cost(self, inputs: dict[str, Any], params: dict[str, Any]) -> float:
+        n_rows, input_dim = inputs.get("input", {})["train_X"].shape
+        latent_dim = int(params.get("latent_dim", 5))
+        epochs = int(params.get("epochs", 50))
+        batch_size = int(params.get("batch_size", 32))
+        mid = max(latent_dim + 2, (input_dim + latent_dim) // 2)
+        # Forward pass through encoder and decoder, ~3x for backward and optimizer step
+        flops_per_row = 3 * 2 * 2 * (input_dim * mid + mid * latent_dim)
+        per_epoch = n_rows * flops_per_row / FLOPS_PER_S + -(-n_rows // batch_size) * BATCH_OVERHEAD_S
+        return epochs * per_epoch
+
+    def estimate_memory(self, inputs: dict[str, Any], params: dict[str, Any]) -> float:
+        data = inputs.get("input", {})
+        # Tensor copies of the features, full-batch encode and per-sample errors
+        return 3 * (data["train_X"].nbytes + data["test_X"].nbytes) / 2**20
+
     def execute(self, inputs: dict[str, Any], params: dict[str, Any]) -> dict[str, Any]:
         data = inputs.get("input", {})
         train_features = data["train_X"]
@@ -90,16 +137,23 @@ class AutoencoderNode(MLNode):
         epochs = int(params.get("epochs", 50))
         lr = float(params.get("learning_rate", 0.001))
         batch_size = int(params.get("batch_size", 32))
+        seed = params.get("seed")
         input_dim = train_features.shape[1]
 
         device = torch.device("cpu")
         model = Autoencoder(input_dim, latent_dim).to(device)
+
+        # Weight init and shuffling draw from a private generator, never the global RNG
+        generator = None
+        if seed is not None:
+            generator = torch.Generator().manual_seed(int(seed))
+            model.reset_parameters(generator)
         optimizer = torch.optim.Adam(model.parameters(), lr=lr)
         criterion = nn.MSELoss()
 
         train_tensor = torch.tensor(train_features, dtype=torch.float32)
         dataset = TensorDataset(train_tensor)
-        loader = DataLoader(dataset, batch_size=batch_size, shuffle=True)
+        loader = DataLoader(dataset, batch_size=batch_size, shuffle=True, generator=generator)
 
         losses = []
         for epoch in range(epochs):
@@ -114,14 +168,18 @@ class AutoencoderNode(MLNode):
                 epoch_loss += loss.item() * batch.size(0)
             avg_loss = epoch_loss / len(train_tensor)
             losses.append(avg_loss)
+            checkpoint()
 
         # Encode both train and test
         model.eval()
         with torch.no_grad():
             _, train_encoded = model(train_tensor.to(device))
             test_tensor = torch.tensor(test_features, dtype=torch.float32).to(device)
-            test_recon, test_encoded = model(test_tensor)
-            test_loss = criterion(test_recon, test_tensor).item()
+            _, test_encoded = model(test_tensor)
+
+        train_errors = reconstruction_errors(model, train_features)
+        test_errors = reconstruction_errors(model, test_features)
+        test_loss = float(test_errors.mean())
 
         return {
             "output": {
@@ -131,6 +189,12 @@ class AutoencoderNode(MLNode):
                 "test_y": data["test_y"],
                 "train_dates": data.get("train_dates"),
                 "test_dates": data.get("test_dates"),
+                "model": model,
+                "scaler": data.get("scaler"),
+                "fill_method": data.get("fill_method"),
+                "lag_days": data.get("lag_days"),
+                "train_errors": train_errors,
+                "test_errors": test_errors,
             },
             "metrics": {
                 "final_train_loss": round(losses[-1], 6),
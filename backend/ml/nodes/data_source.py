@@ -1,11 +1,9 @@
 """Data source node: loads city weather CSV data."""
 import pandas as pd
-from pathlib import Path
 from typing import Any
 from ..base import MLNode
 from ..registry import register
-
-DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
+from ...data_index import DATA_DIR, list_cities
 
 
 @register
@@ -20,7 +18,7 @@ class DataSourceNode(MLNode):
 
     @property
     def parameter_schema(self):
-        cities = [f.stem for f in sorted(DATA_DIR.glob("*.csv"))]
+        cities = list_cities()
         return [
             {
                 "name": "city",
@@ -0,0 +1,106 @@
+"""Ensemble node: stacks upstream model predictions with learned blend weights."""
+import numpy as np
+from typing import Any
+from ..base import MLNode
+from ..registry import register
+from .xgboost_node import prediction_chart, regression_metrics
+
+
+def blend_weights(oof: np.ndarray, y: np.ndarray, regularization: float) -> np.ndarray:
+    """Closed-form ridge solve for weights w minimizing |oof @ w - y|^2 + reg * |w|^2.
+
+    Uses a least-squares solve of the normal equations, so collinear inputs
+    (e.g. two identical models) with reg=0 get the minimum-norm weights
+    instead of a singular-matrix error.
+    """
+    gram = oof.T @ oof
+    # Scale the penalty to the data so the slider means the same thing for any row count
+    penalty = regularization * np.trace(gram) / len(gram)
+    return np.linalg.lstsq(gram + penalty * np.eye(len(gram)), oof.T @ y, rcond=None)[0]
+
+
+def _same_rows(a: dict, b: dict) -> bool:
+    """True if two prediction outputs cover the same days with the same targets."""
+    for key in ("train_actual", "test_actual", "train_dates", "test_dates"):
+        if a.get(key) is None and b.get(key) is None:
+            continue
+        if a.get(key) is None or b.get(key) is None or not np.array_equal(a[key], b[key]):
+            return False
+    return True
+
+
+@register
+class EnsembleNode(MLNode):
+    node_type = "ensemble"
+    display_name = "Ensemble"
+    category = "model"
+
+    @property
+    def input_ports(self):
+        return [{"name": "input", "datatype": "predictions", "multiple": True}]
+
+    @property
+    def output_ports(self):
+        return [{"name": "output", "datatype": "predictions"}]
+
+    @property
+    def parameter_schema(self):
+        return [
+            {
+                "name": "regularization",
+                "type": "slider",
+                "default": 0.01,
+                "min": 0.0,
+                "max": 1.0,
+                "step": 0.01,
+            },
+        ]
+
+    def execute(self, inputs: dict[str, Any], params: dict[str, Any]) -> dict[str, Any]:
+        models = inputs.get("input", {})
+        if len(models) < 2:
+            raise ValueError("Ensemble needs at least two upstream models")
+        missing = [nid for nid, m in models.items() if m.get("oof_pred") is None]
+        if missing:
+            raise ValueError(
+                f"Ensemble needs out-of-fold predictions; set oof_folds >= 2 on: {', '.join(missing)}"
+            )
+
+        names = list(models)
+        first = models[names[0]]
+        train_y = first["train_actual"]
+        test_y = first["test_actual"]
+        for nid in names[1:]:
+            if not _same_rows(first, models[nid]):
+                raise ValueError(
+                    f"Ensemble inputs {names[0]} and {nid} must come from the same city, data split and preprocessing"
+                )
+
+        oof = np.column_stack([models[nid]["oof_pred"] for nid in names]).astype(np.float64)
+        train_preds = np.column_stack([models[nid]["train_pred"] for nid in names])
+        test_preds = np.column_stack([models[nid]["test_pred"] for nid in names])
+
+        weights = blend_weights(oof, train_y.astype(np.float64), float(params.get("regularization", 0.01)))
+        oof_blend = oof @ weights
+        train_pred = train_preds @ weights
+        test_pred = test_preds @ weights
+
+        metrics = regression_metrics(train_y, train_pred, test_y, test_pred)
+        metrics["oof_rmse"] = round(float(np.sqrt(np.mean((oof_blend - train_y) ** 2))), 4)
+        for nid, w, col in zip(names, weights, test_preds.T):
+            metrics[f"weight_{nid}"] = round(float(w), 4)
+            metrics[f"test_rmse_{nid}"] = round(float(np.sqrt(np.mean((col - test_y) ** 2))), 4)
+        metrics["chart_data"] = prediction_chart(test_y, test_pred, first.get("test_dates"))
+
+        return {
+            "output": {
+                "train_pred": train_pred,
+                "test_pred": test_pred,
+                "oof_pred": oof_blend,
+                "train_actual": train_y,
+                "test_actual": test_y,
+                "train_dates": first.get("train_dates"),
+                "test_dates": first.get("test_dates"),
+            },
+            "metrics": metrics,
+        }
@@ -12,6 +12,31 @@ FEATURE_COLS = [
 ]
 
 
+def build_features(df: pd.DataFrame, fill_method: str, lag_days: int) -> tuple[pd.DataFrame, list[str]]:
+    """Fill missing values and add lag features. Returns (df, feature column names)."""
+    df = df.copy()
+    if fill_method == "interpolate":
+        df[FEATURE_COLS] = df[FEATURE_COLS].interpolate(method="linear")
+    elif fill_method == "ffill":
+        df[FEATURE_COLS] = df[FEATURE_COLS].ffill()
+    elif fill_method == "mean":
+        df[FEATURE_COLS] = df[FEATURE_COLS].fillna(df[FEATURE_COLS].mean())
+    else:
+        df[FEATURE_COLS] = df[FEATURE_COLS].fillna(0)
+    # Fill any remaining NaNs at edges
+    df[FEATURE_COLS] = df[FEATURE_COLS].bfill().ffill().fillna(0)
+
+    feature_cols = list(FEATURE_COLS)
+    if lag_days > 0:
+        for lag in range(1, lag_days + 1):
+            for col in ["temp_max", "temp_min", "precipitation"]:
+                lag_col = f"{col}_lag{lag}"
+                df[lag_col] = df[col].shift(lag)
+                feature_cols.append(lag_col)
+        df.dropna(inplace=True)
+    return df, feature_cols
+
+
 @register
 class PreprocessNode(MLNode):
     node_type = "preprocess"
@@ -60,30 +85,8 @@ class PreprocessNode(MLNode):
         fill_method = params.get("fill_method", "interpolate")
         lag_days = int(params.get("add_lag_features", 3))
 
-        # Fill missing values
-        for df in [train_df, test_df]:
-            if fill_method == "interpolate":
-                df[FEATURE_COLS] = df[FEATURE_COLS].interpolate(method="linear")
-            elif fill_method == "ffill":
-                df[FEATURE_COLS] = df[FEATURE_COLS].ffill()
-            elif fill_method == "mean":
-                df[FEATURE_COLS] = df[FEATURE_COLS].fillna(df[FEATURE_COLS].mean())
-            else:
-                df[FEATURE_COLS] = df[FEATURE_COLS].fillna(0)
-            # Fill any remaining NaNs at edges
-            df[FEATURE_COLS] = df[FEATURE_COLS].bfill().ffill().fillna(0)
-
-        # Add lag features
-        all_feature_cols = list(FEATURE_COLS)
-        if lag_days > 0:
-            for df in [train_df, test_df]:
-                for lag in range(1, lag_days + 1):
-                    for col in ["temp_max", "temp_min", "precipitation"]:
-                        lag_col = f"{col}_lag{lag}"
-                        df[lag_col] = df[col].shift(lag)
-                        if lag_col not in all_feature_cols:
-                            all_feature_cols.append(lag_col)
-                df.dropna(inplace=True)
+        train_df, all_feature_cols = build_features(train_df, fill_method, lag_days)
+        test_df, _ = build_features(test_df, fill_method, lag_days)
 
         # Scale features
         if scaler_type == "standard":
@@ -108,6 +111,8 @@ class PreprocessNode(MLNode):
                 "test_y": test_df["temp_max"].values.astype(np.float32),
                 "feature_names": all_feature_cols,
                 "scaler": scaler,
+                "fill_method": fill_method,
+                "lag_days": lag_days,
                 "train_dates": train_df["date"].values,
                 "test_dates": test_df["date"].values,
             },
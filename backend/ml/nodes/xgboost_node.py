@@ -2,9 +2,50 @@
 import numpy as np
 from typing import Any
 from xgboost import XGBRegressor
+from xgboost.callback import TrainingCallback
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+from sklearn.model_selection import KFold
 from ..base import MLNode
+from ..governor import checkpoint
 from ..registry import register
+from ..reproducibility import DETERMINISTIC_THREADS
+
+# Cost model constant for estimate_cost: seconds per row x feature x tree level
+CELL_LEVEL_S = 2e-9
+
+
+class BudgetCallback(TrainingCallback):
+    """Checks the run budget after every boosting round."""
+
+    def after_iteration(self, model, epoch, evals_log) -> bool:
+        checkpoint()
+        return False
+
+
+def prediction_chart(test_y, test_pred, test_dates) -> list[dict]:
+    """Build prediction vs actual chart data, limited to ~100 points."""
+    chart_data = []
+    step = max(1, len(test_y) // 100)
+    for i in range(0, len(test_y), step):
+        entry = {
+            "actual": round(float(test_y[i]), 2),
+            "predicted": round(float(test_pred[i]), 2),
+        }
+        if test_dates is not None:
+            entry["date"] = str(test_dates[i])[:10]
+        else:
+            entry["index"] = i
+        chart_data.append(entry)
+    return chart_data
+
+
+def regression_metrics(train_y, train_pred, test_y, test_pred) -> dict:
+    return {
+        "train_rmse": round(float(np.sqrt(mean_squared_error(train_y, train_pred))), 4),
+        "test_rmse": round(float(np.sqrt(mean_squared_error(test_y, test_pred))), 4),
+        "test_mae": round(float(mean_absolute_error(test_y, test_pred)), 4),
+        "test_r2": round(float(r2_score(test_y, test_pred)), 4),
+    }
 
 
 @register
@@ -56,8 +97,29 @@ class XGBoostNode(MLNode):
                 "max": 1.0,
                 "step": 0.05,
             },
+            {
+                "name": "oof_folds",
+                "type": "slider",
+                "default": 0,
+                "min": 0,
+                "max": 10,
+                "step": 1,
+            },
         ]
 
+    def estimate_cost(self, inputs: dict[str, Any], params: dict[str, Any]) -> float:
+        n_rows, n_features = inputs.get("input", {})["train_X"].shape
+        n_estimators = int(params.get("n_estimators", 100))
+        max_depth = int(params.get("max_depth", 6))
+        oof_folds = int(params.get("oof_folds", 0))
+        fits = 1 + (oof_folds if oof_folds >= 2 else 0)
+        return fits * n_estimators * n_rows * n_features * max_depth * CELL_LEVEL_S
+
+    def estimate_memory(self, inputs: dict[str, Any], params: dict[str, Any]) -> float:
+        data = inputs.get("input", {})
+        # DMatrix copy plus quantized histogram index; fold models are fit one at a time
+        return 2 * (data["train_X"].nbytes + data["test_X"].nbytes) / 2**20
+
     def execute(self, inputs: dict[str, Any], params: dict[str, Any]) -> dict[str, Any]:
         data = inputs.get("input", {})
         train_X = data["train_X"]
@@ -65,45 +127,48 @@ class XGBoostNode(MLNode):
         train_y = data["train_y"]
         test_y = data["test_y"]
 
-        model = XGBRegressor(
+        seed = params.get("seed")
+        model_params = dict(
             n_estimators=int(params.get("n_estimators", 100)),
             max_depth=int(params.get("max_depth", 6)),
             learning_rate=float(params.get("learning_rate", 0.1)),
             subsample=float(params.get("subsample", 0.8)),
-            random_state=42,
+            random_state=int(seed) if seed is not None else 42,
+            n_jobs=DETERMINISTIC_THREADS if seed is not None else None,
             verbosity=0,
+            callbacks=[BudgetCallback()],
         )
+        model = XGBRegressor(**model_params)
         model.fit(train_X, train_y)
 
         train_pred = model.predict(train_X)
         test_pred = model.predict(test_X)
 
-        # Build prediction vs actual chart data
+        # Out-of-fold train predictions, needed by downstream stacking nodes
+        oof_folds = int(params.get("oof_folds", 0))
+        oof_pred = None
+        if oof_folds >= 2:
+            oof_pred = np.empty_like(train_pred)
+            for fit_idx, holdout_idx in KFold(n_splits=oof_folds).split(train_X):
+                fold_model = XGBRegressor(**model_params)
+                fold_model.fit(train_X[fit_idx], train_y[fit_idx])
+                oof_pred[holdout_idx] = fold_model.predict(train_X[holdout_idx])
+
         test_dates = data.get("test_dates")
-        chart_data = []
-        step = max(1, len(test_y) // 100)  # Limit to ~100 points for chart
-        for i in range(0, len(test_y), step):
-            entry = {
-                "actual": round(float(test_y[i]), 2),
-                "predicted": round(float(test_pred[i]), 2),
-            }
-            if test_dates is not None:
-                entry["date"] = str(test_dates[i])[:10]
-            else:
-                entry["index"] = i
-            chart_data.append(entry)
+        metrics = regression_metrics(train_y, train_pred, test_y, test_pred)
+        if oof_pred is not None:
+            metrics["oof_rmse"] = round(float(np.sqrt(mean_squared_error(train_y, oof_pred))), 4)
+        metrics["chart_data"] = prediction_chart(test_y, test_pred, test_dates)
 
         return {
             "output": {
                 "train_pred": train_pred,
                 "test_pred": test_pred,
+                "oof_pred": oof_pred,
+                "train_actual": train_y,
                 "test_actual": test_y,
+                "train_dates": data.get("train_dates"),
+                "test_dates": test_dates,
             },
-            "metrics": {
-                "train_rmse": round(float(np.sqrt(mean_squared_error(train_y, train_pred))), 4),
-                "test_rmse": round(float(np.sqrt(mean_squared_error(test_y, test_pred))), 4),
-                "test_mae": round(float(mean_absolute_error(test_y, test_pred)), 4),
-                "test_r2": round(float(r2_score(test_y, test_pred)), 4),
-                "chart_data": chart_data,
-            },
+            "metrics": metrics,
         }
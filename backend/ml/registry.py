@@ -24,4 +24,4 @@ def get_all_metadata() -> list[dict]:
 
 def discover_nodes():
     """Import all node modules to trigger @register decorators."""
-    from .nodes import data_source, preprocess, autoencoder, xgboost_node  # noqa: F401
+    from .nodes import data_source, preprocess, autoencoder, xgboost_node, anomaly, ensemble  # noqa: F401
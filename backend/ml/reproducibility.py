@@ -0,0 +1,67 @@
+"""Deterministic execution helpers and output fingerprinting."""
+import hashlib
+from typing import Any
+import numpy as np
+import pandas as pd
+import torch
+
+# Thread count used for XGBoost in reproducible mode. Reductions split across a
+# different number of threads can round differently, so it has to be fixed.
+DETERMINISTIC_THREADS = 1
+
+
+def configure_torch(num_threads: int) -> None:
+    """Fix torch's process-wide threading and kernel choice once at startup.
+
+    Both settings are global, so toggling them per run would leak into
+    concurrent runs. With one fixed thread count and deterministic kernels
+    for every run, seeded runs are reproducible without serializing them,
+    and unseeded runs never have their threading changed under them.
+    """
+    torch.set_num_threads(num_threads)
+    # warn_only: an op without a deterministic CPU kernel warns instead of failing
+    torch.use_deterministic_algorithms(True, warn_only=True)
+
+
+def _update(h, obj: Any) -> None:
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, np.ndarray):
+        h.update(f"ndarray:{obj.dtype}:{obj.shape};".encode())
+        if obj.dtype == object:
+            _update(h, obj.tolist())
+        else:
+            h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, np.generic):
+        _update(h, obj.item())
+    elif isinstance(obj, pd.DataFrame):
+        h.update(f"DataFrame:{list(obj.columns)};".encode())
+        h.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    elif isinstance(obj, torch.Tensor):
+        _update(h, obj.detach().cpu().numpy())
+    elif isinstance(obj, torch.nn.Module):
+        _update(h, dict(obj.state_dict()))
+    elif isinstance(obj, dict):
+        h.update(b"dict{")
+        for key in sorted(obj, key=str):
+            _update(h, str(key))
+            _update(h, obj[key])
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}[".encode())
+        for item in obj:
+            _update(h, item)
+        h.update(b"]")
+    elif hasattr(obj, "__dict__"):
+        # Fitted estimators such as sklearn scalers: hash their learned state
+        h.update(f"{type(obj).__name__}:".encode())
+        _update(h, vars(obj))
+    else:
+        h.update(f"{type(obj).__name__};".encode())
+
+
+def fingerprint(outputs: dict[str, Any]) -> str:
+    """Content hash of a node's outputs. Identical outputs give identical fingerprints."""
+    h = hashlib.sha256()
+    _update(h, outputs)
+    return h.hexdigest()[:16]
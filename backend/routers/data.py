@@ -1,13 +1,20 @@
 """Data-related routes."""
-from fastapi import APIRouter
-from pathlib import Path
+from fastapi import APIRouter, HTTPException
+from .. import data_index
 
 router = APIRouter(prefix="/api/data", tags=["data"])
 
-DATA_DIR = Path(__file__).resolve().parent.parent / "data"
-
 
 @router.get("/cities")
 async def list_cities():
-    cities = [f.stem for f in sorted(DATA_DIR.glob("*.csv"))]
-    return {"cities": cities}
+    return {"cities": data_index.list_cities()}
+
+
+# Plain def so FastAPI runs it in the threadpool: a changed file triggers a
+# synchronous pandas recompute that would otherwise block the event loop
+@router.get("/{city}/summary")
+def city_summary(city: str):
+    try:
+        return data_index.get_summary(city)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
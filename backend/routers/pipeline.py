@@ -1,25 +1,37 @@
 """Pipeline execution router."""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Any
 from ..ml.executor import run_pipeline
+from ..ml.governor import FairScheduler, QueueFull, RunBudget, client_identity
 
 router = APIRouter(prefix="/api/pipeline", tags=["pipeline"])
 
+scheduler = FairScheduler()
+
 
 class PipelineRequest(BaseModel):
     nodes: list[dict[str, Any]]
     edges: list[dict[str, Any]]
     target_node: str | None = None
+    seed: int | None = None
 
 
 @router.post("/run")
-async def run(req: PipelineRequest):
+async def run(req: PipelineRequest, request: Request):
+    user, address = client_identity(request.headers, request.client.host if request.client else None)
     try:
-        results = run_pipeline(
-            {"nodes": req.nodes, "edges": req.edges},
-            target_node=req.target_node,
-        )
+        async with scheduler.slot(user, address):
+            results = await run_in_threadpool(
+                run_pipeline,
+                {"nodes": req.nodes, "edges": req.edges},
+                target_node=req.target_node,
+                seed=req.seed,
+                budget=RunBudget(),
+            )
         return {"status": "ok", "results": results}
+    except QueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,124 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("xgboost")
+pytest.importorskip("sklearn")
+
+from backend.ml import registry  # noqa: E402
+from backend.ml.base import MLNode  # noqa: E402
+from backend.ml.executor import run_pipeline  # noqa: E402
+from backend.ml.nodes.ensemble import EnsembleNode, blend_weights  # noqa: E402
+
+
+def _predictions(pred, actual, dates, noise=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    train_pred = pred[:80] + noise * rng.normal(size=80)
+    return {
+        "train_pred": train_pred,
+        "oof_pred": train_pred,
+        "test_pred": pred[80:],
+        "train_actual": actual[:80],
+        "test_actual": actual[80:],
+        "train_dates": dates[:80],
+        "test_dates": dates[80:],
+    }
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(0)
+    actual = rng.normal(20, 5, size=100).astype(np.float32)
+    dates = np.arange("2020-01-01", 100, dtype="datetime64[D]")
+    return actual, dates
+
+
+def test_blend_weights_recover_known_blend():
+    rng = np.random.default_rng(1)
+    preds = rng.normal(size=(500, 2))
+    y = preds @ np.array([0.3, 0.7])
+    np.testing.assert_allclose(blend_weights(preds, y, 0.0), [0.3, 0.7], atol=1e-8)
+
+
+def test_blend_weights_handle_identical_inputs_without_regularization():
+    p = np.random.default_rng(2).normal(size=(100, 1))
+    weights = blend_weights(np.hstack([p, p]), p[:, 0], 0.0)
+    np.testing.assert_allclose(weights, [0.5, 0.5], atol=1e-8)
+
+
+def test_ensemble_rejects_inputs_from_different_cities(series):
+    actual, dates = series
+    other_city = actual + 3.0
+    models = {
+        "a": _predictions(actual, actual, dates),
+        "b": _predictions(other_city, other_city, dates),
+    }
+    with pytest.raises(ValueError, match="same city"):
+        EnsembleNode().execute({"input": models}, {})
+
+
+def test_ensemble_rejects_shifted_dates(series):
+    actual, dates = series
+    models = {
+        "a": _predictions(actual, actual, dates),
+        "b": _predictions(actual, actual, dates + 1),
+    }
+    with pytest.raises(ValueError, match="same city"):
+        EnsembleNode().execute({"input": models}, {})
+
+
+def test_ensemble_prefers_the_better_model(series):
+    actual, dates = series
+    models = {
+        "good": _predictions(actual, actual, dates, noise=0.1, seed=1),
+        "bad": _predictions(actual, actual, dates, noise=5.0, seed=2),
+    }
+    metrics = EnsembleNode().execute({"input": models}, {"regularization": 0.0})["metrics"]
+    assert metrics["weight_good"] > 0.9
+    assert abs(metrics["weight_bad"]) < 0.1
+
+
+class _Constant(MLNode):
+    node_type = "test_constant"
+    display_name = "Constant"
+    category = "data"
+
+    @property
+    def output_ports(self):
+        return [{"name": "output", "datatype": "value"}]
+
+    def execute(self, inputs, params):
+        return {"output": params["value"]}
+
+
+class _Collect(MLNode):
+    node_type = "test_collect"
+    display_name = "Collect"
+    category = "model"
+
+    @property
+    def input_ports(self):
+        return [{"name": "input", "datatype": "value", "multiple": True}, {"name": "single", "datatype": "value"}]
+
+    def execute(self, inputs, params):
+        return {"metrics": {"collected": inputs.get("input"), "single": inputs.get("single")}}
+
+
+def test_executor_collects_every_edge_into_multiple_port(monkeypatch):
+    monkeypatch.setitem(registry._REGISTRY, "test_constant", _Constant)
+    monkeypatch.setitem(registry._REGISTRY, "test_collect", _Collect)
+    pipeline = {
+        "nodes": [
+            {"id": "a", "type": "test_constant", "params": {"value": 1}},
+            {"id": "b", "type": "test_constant", "params": {"value": 2}},
+            {"id": "c", "type": "test_constant", "params": {"value": 3}},
+            {"id": "sink", "type": "test_collect", "params": {}},
+        ],
+        "edges": [
+            {"source": "a", "target": "sink", "targetHandle": "input"},
+            {"source": "b", "target": "sink", "targetHandle": "input"},
+            {"source": "c", "target": "sink", "targetHandle": "single"},
+        ],
+    }
+    metrics = run_pipeline(pipeline)["sink"]["metrics"]
+    assert metrics["collected"] == {"a": 1, "b": 2}
+    assert metrics["single"] == 3
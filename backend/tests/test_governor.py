@@ -0,0 +1,244 @@
+import asyncio
+
+import pytest
+
+from backend.ml.governor import (
+    BudgetExceeded,
+    FairScheduler,
+    QueueFull,
+    RunBudget,
+    budget_scope,
+    checkpoint,
+    client_identity,
+)
+
+
+async def _hold(scheduler, user, log, label):
+    async with scheduler.slot(user):
+        log.append(label)
+        await asyncio.sleep(0.01)
+
+
+def test_fast_path_takes_free_slot():
+    async def scenario():
+        scheduler = FairScheduler(slots=2)
+        await scheduler._acquire("a")
+        await scheduler._acquire("b")
+        assert scheduler._running == 2
+        assert not scheduler._queues
+        scheduler._release()
+        scheduler._release()
+        assert scheduler._running == 0
+
+    asyncio.run(scenario())
+
+
+def test_round_robin_across_users():
+    async def scenario():
+        scheduler = FairScheduler(slots=1, max_queued=10)
+        log = []
+        tasks = [asyncio.create_task(_hold(scheduler, "heavy", log, f"heavy{i}")) for i in range(4)]
+        await asyncio.sleep(0)
+        tasks += [asyncio.create_task(_hold(scheduler, "light", log, f"light{i}")) for i in range(2)]
+        await asyncio.gather(*tasks)
+        return log, scheduler
+
+    log, scheduler = asyncio.run(scenario())
+    assert log == ["heavy0", "heavy1", "light0", "heavy2", "light1", "heavy3"]
+    assert scheduler._running == 0
+    assert not scheduler._queues
+
+
+def test_queue_full_is_per_user():
+    async def scenario():
+        scheduler = FairScheduler(slots=1, max_queued=1)
+        await scheduler._acquire("a")
+        waiting = asyncio.create_task(scheduler._acquire("a"))
+        await asyncio.sleep(0)
+        with pytest.raises(QueueFull):
+            await scheduler._acquire("a")
+        # Another user still gets a place in the queue
+        other = asyncio.create_task(scheduler._acquire("b"))
+        await asyncio.sleep(0)
+        assert not other.done()
+        waiting.cancel()
+        other.cancel()
+        await asyncio.gather(waiting, other, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_skipped_by_release():
+    async def scenario():
+        scheduler = FairScheduler(slots=1)
+        await scheduler._acquire("a")
+        waiter = asyncio.create_task(scheduler._acquire("b"))
+        await asyncio.sleep(0)
+        # Cancel, then release before the cancelled task gets to run its handler
+        waiter.cancel()
+        scheduler._release()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert scheduler._running == 0
+        assert not scheduler._queues
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_leaves_queue():
+    async def scenario():
+        scheduler = FairScheduler(slots=1)
+        await scheduler._acquire("a")
+        waiter = asyncio.create_task(scheduler._acquire("b"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert not scheduler._queues
+        scheduler._release()
+        assert scheduler._running == 0
+
+    asyncio.run(scenario())
+
+
+def test_slot_handed_to_cancelled_waiter_is_passed_on():
+    async def scenario():
+        scheduler = FairScheduler(slots=1)
+        await scheduler._acquire("a")
+        first = asyncio.create_task(scheduler._acquire("b"))
+        second = asyncio.create_task(scheduler._acquire("c"))
+        await asyncio.sleep(0)
+        # Slot goes to "b", which is cancelled before it resumes
+        scheduler._release()
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await second
+        assert scheduler._running == 1
+
+    asyncio.run(scenario())
+
+
+def test_identity_from_session_behind_trusted_proxy():
+    headers = {"x-forwarded-for": "10.0.0.5", "x-session-id": "tab1"}
+    assert client_identity(headers, "127.0.0.1") == ("10.0.0.5/tab1", "10.0.0.5")
+
+
+def test_client_supplied_forwarded_for_is_ignored():
+    # The client forges an entry; the proxy appends the real peer after it
+    for forged in ("1.2.3.4", "9.9.9.9, 8.8.8.8", "127.0.0.1"):
+        headers = {"x-forwarded-for": f"{forged}, 10.0.0.5", "x-session-id": "rotated"}
+        assert client_identity(headers, "127.0.0.1") == ("10.0.0.5/rotated", "10.0.0.5")
+
+
+def test_forged_forwarded_for_cannot_dodge_address_cap():
+    async def scenario():
+        scheduler = FairScheduler(slots=1, max_queued=3, max_queued_per_address=2)
+        await scheduler._acquire("holder", "other")
+        waiters = []
+        for i in range(2):
+            user, address = client_identity(
+                {"x-forwarded-for": f"198.51.100.{i}, 10.0.0.5", "x-session-id": f"s{i}"}, "127.0.0.1"
+            )
+            waiters.append(asyncio.create_task(scheduler._acquire(user, address)))
+        await asyncio.sleep(0)
+        user, address = client_identity(
+            {"x-forwarded-for": "198.51.100.99, 10.0.0.5", "x-session-id": "s99"}, "127.0.0.1"
+        )
+        with pytest.raises(QueueFull):
+            await scheduler._acquire(user, address)
+        for task in waiters:
+            task.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_forwarded_for_ignored_from_untrusted_peer():
+    headers = {"x-forwarded-for": "10.0.0.5"}
+    assert client_identity(headers, "203.0.113.9") == ("203.0.113.9", "203.0.113.9")
+
+
+def test_two_sessions_through_proxy_interleave():
+    async def scenario():
+        scheduler = FairScheduler(slots=1, max_queued=10)
+        log = []
+        proxy = "127.0.0.1"
+        heavy = client_identity({"x-session-id": "heavy"}, proxy)
+        light = client_identity({"x-session-id": "light"}, proxy)
+
+        async def hold(identity, label):
+            async with scheduler.slot(*identity):
+                log.append(label)
+                await asyncio.sleep(0.01)
+
+        tasks = [asyncio.create_task(hold(heavy, f"heavy{i}")) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks += [asyncio.create_task(hold(light, f"light{i}")) for i in range(2)]
+        await asyncio.gather(*tasks)
+        return log
+
+    assert asyncio.run(scenario()) == ["heavy0", "heavy1", "light0", "heavy2", "light1"]
+
+
+def test_rotating_sessions_capped_per_address():
+    async def scenario():
+        scheduler = FairScheduler(slots=1, max_queued=3, max_queued_per_address=2)
+        await scheduler._acquire("addr/s0", "addr")
+        waiters = [asyncio.create_task(scheduler._acquire(f"addr/s{i}", "addr")) for i in (1, 2)]
+        await asyncio.sleep(0)
+        with pytest.raises(QueueFull):
+            await scheduler._acquire("addr/s3", "addr")
+        # Other addresses are unaffected
+        other = asyncio.create_task(scheduler._acquire("other/s0", "other"))
+        await asyncio.sleep(0)
+        assert not other.done()
+        for task in (*waiters, other):
+            task.cancel()
+        await asyncio.gather(*waiters, other, return_exceptions=True)
+        assert not scheduler._queued_by_address
+
+    asyncio.run(scenario())
+
+
+class _Array:
+    def __init__(self, n):
+        self.nbytes = n
+
+
+def test_budget_admits_only_what_fits():
+    budget = RunBudget(time_s=10, memory_mb=100)
+    budget.admit("small", 1, 50)
+    with pytest.raises(BudgetExceeded):
+        budget.admit("slow", 60, 0)
+    with pytest.raises(BudgetExceeded):
+        budget.admit("big", 1, 150)
+
+
+def test_budget_holds_shared_outputs_once():
+    budget = RunBudget(memory_mb=100)
+    shared = _Array(30 * 2**20)
+    budget.hold({"output": {"train_X": shared}})
+    budget.hold({"output": {"train_X": shared, "extra": _Array(10 * 2**20)}})
+    assert budget.held_mb == pytest.approx(40)
+    with pytest.raises(BudgetExceeded):
+        budget.admit("next", 0, 70)
+    with pytest.raises(BudgetExceeded):
+        budget.hold([_Array(70 * 2**20)])
+
+
+def test_checkpoint_cancels_only_inside_budgeted_run():
+    with budget_scope(RunBudget(time_s=-1)):
+        with pytest.raises(BudgetExceeded):
+            checkpoint()
+    checkpoint()
+
+
+def test_budget_clock_starts_at_execution():
+    budget = RunBudget(time_s=1)
+    budget._start -= 5  # Simulate time spent waiting before the run started
+    with pytest.raises(BudgetExceeded):
+        budget.check()
+    budget.start()
+    budget.check()
+    assert budget.remaining_s() > 0.9
@@ -13,6 +13,8 @@ export default function App() {
   const dataPreviewHeight = usePipelineStore((s) => s.dataPreviewHeight);
   const sidePanelWidth = usePipelineStore((s) => s.sidePanelWidth);
   const setSidePanelWidth = usePipelineStore((s) => s.setSidePanelWidth);
+  const seed = usePipelineStore((s) => s.seed);
+  const setSeed = usePipelineStore((s) => s.setSeed);
   const [isDraggingSide, setIsDraggingSide] = useState(false);
 
   useEffect(() => {
@@ -48,13 +50,31 @@ export default function App() {
           </h1>
           <NodePalette />
         </div>
-        <button
-          onClick={() => run()}
-          disabled={isRunning}
-          className="px-4 py-1.5 bg-blue-600 hover:bg-blue-500 disabled:bg-gray-700 disabled:text-gray-500 text-white text-sm font-medium rounded-lg transition-colors"
-        >
-          {isRunning ? 'Running...' : 'Run Pipeline'}
-        </button>
+        <div className="flex items-center gap-3">
+          <label className="flex items-center gap-1.5 text-xs text-gray-400" title="Seed every node and fingerprint outputs so identical graphs give identical results">
+            <input
+              type="checkbox"
+              checked={seed !== null}
+              onChange={(e) => setSeed(e.target.checked ? 42 : null)}
+            />
+            Reproducible
+            {seed !== null && (
+              <input
+                type="number"
+                value={seed}
+                onChange={(e) => setSeed(Number.parseInt(e.target.value, 10) || 0)}
+                className="w-16 px-1 py-0.5 bg-gray-800 border border-gray-700 rounded text-white font-mono"
+              />
+            )}
+          </label>
+          <button
+            onClick={() => run()}
+            disabled={isRunning}
+            className="px-4 py-1.5 bg-blue-600 hover:bg-blue-500 disabled:bg-gray-700 disabled:text-gray-500 text-white text-sm font-medium rounded-lg transition-colors"
+          >
+            {isRunning ? 'Running...' : 'Run Pipeline'}
+          </button>
+        </div>
       </div>
 
       {/* Main content: left canvas + right panels */}
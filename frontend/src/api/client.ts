@@ -1,12 +1,38 @@
 import axios from 'axios';
 
-const api = axios.create({ baseURL: '/api' });
+// Per-tab session ID so the backend can schedule runs fairly between users.
+// Advisory only: it identifies a tab for scheduling, it is not authentication.
+function randomId(): string {
+  // crypto.randomUUID only exists in secure contexts (HTTPS or localhost);
+  // remote users on plain HTTP through the dev proxy need a fallback
+  if (typeof crypto !== 'undefined' && typeof crypto.randomUUID === 'function') {
+    return crypto.randomUUID();
+  }
+  const bytes = new Uint8Array(16);
+  if (typeof crypto !== 'undefined' && typeof crypto.getRandomValues === 'function') {
+    crypto.getRandomValues(bytes);
+  } else {
+    for (let i = 0; i < bytes.length; i++) bytes[i] = Math.floor(Math.random() * 256);
+  }
+  return Array.from(bytes, (b) => b.toString(16).padStart(2, '0')).join('');
+}
+
+function sessionId(): string {
+  let id = sessionStorage.getItem('sessionId');
+  if (!id) {
+    id = randomId();
+    sessionStorage.setItem('sessionId', id);
+  }
+  return id;
+}
+
+const api = axios.create({ baseURL: '/api', headers: { 'X-Session-Id': sessionId() } });
 
 export interface NodeTypeMeta {
   node_type: string;
   display_name: string;
   category: string;
-  input_ports: { name: string; datatype: string }[];
+  input_ports: { name: string; datatype: string; multiple?: boolean }[];
   output_ports: { name: string; datatype: string }[];
   parameter_schema: ParamDef[];
 }
@@ -27,9 +53,28 @@ export interface PipelineResult {
     node_type?: string;
     metrics?: Record<string, unknown>;
     preview?: Record<string, unknown>;
+    fingerprint?: string;
   }>;
 }
 
+export interface ColumnStats {
+  min: number | null;
+  max: number | null;
+  mean: number | null;
+  nulls: number;
+  histogram?: { counts: number[]; edges: number[] };
+}
+
+export interface DataSummary {
+  city: string;
+  rows: number;
+  columns: string[];
+  date_range: { start: string; end: string };
+  stats: Record<string, ColumnStats>;
+  overview: Record<string, number | string | null>[];
+  sample: Record<string, unknown>[];
+}
+
 export async function fetchNodeTypes(): Promise<NodeTypeMeta[]> {
   const resp = await api.get('/node-types');
   return resp.data.node_types;
@@ -40,15 +85,22 @@ export async function fetchCities(): Promise<string[]> {
   return resp.data.cities;
 }
 
+export async function fetchDataSummary(city: string): Promise<DataSummary> {
+  const resp = await api.get(`/data/${encodeURIComponent(city)}/summary`);
+  return resp.data;
+}
+
 export async function runPipeline(
   nodes: { id: string; type: string; params: Record<string, unknown> }[],
   edges: { source: string; sourceHandle: string; target: string; targetHandle: string }[],
   targetNode?: string,
+  seed?: number | null,
 ): Promise<PipelineResult> {
   const resp = await api.post('/pipeline/run', {
     nodes,
     edges,
     target_node: targetNode ?? null,
+    seed: seed ?? null,
   });
   return resp.data;
 }
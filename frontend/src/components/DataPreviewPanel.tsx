@@ -1,8 +1,24 @@
 import { useCallback, useRef, useState, useEffect } from 'react';
+import { LineChart, Line, XAxis, YAxis, Tooltip, ResponsiveContainer } from 'recharts';
 import { usePipelineStore } from '../store/pipelineStore';
+import type { DataSummary } from '../api/client';
+import { fetchDataSummary } from '../api/client';
+
+function Histogram({ counts }: { counts: number[] }) {
+  const peak = Math.max(...counts, 1);
+  return (
+    <div className="flex items-end gap-px h-4 w-24">
+      {counts.map((c, i) => (
+        <div key={i} className="flex-1 bg-blue-500/70" style={{ height: `${(c / peak) * 100}%` }} />
+      ))}
+    </div>
+  );
+}
 
 export default function DataPreviewPanel() {
   const results = usePipelineStore((s) => s.results);
+  const nodes = usePipelineStore((s) => s.nodes);
+  const selectedNodeId = usePipelineStore((s) => s.selectedNodeId);
   const dataPreviewHeight = usePipelineStore((s) => s.dataPreviewHeight);
   const setDataPreviewHeight = usePipelineStore((s) => s.setDataPreviewHeight);
   const [isDragging, setIsDragging] = useState(false);
@@ -15,8 +31,38 @@ export default function DataPreviewPanel() {
       )?.preview
     : null;
 
-  const sample = (previewData?.sample as Record<string, unknown>[]) || [];
-  const columns = (previewData?.columns as string[]) || [];
+  // Preview the selected data source, falling back to the first one in the graph
+  const selected = nodes.find((n) => n.id === selectedNodeId && n.data.nodeType === 'data_source');
+  const sourceNode = selected ?? nodes.find((n) => n.data.nodeType === 'data_source');
+  const city = sourceNode?.data.params.city as string | undefined;
+  const [summary, setSummary] = useState<DataSummary | null>(null);
+
+  // Never show the previous city's stats under a new selection
+  useEffect(() => {
+    setSummary(null);
+  }, [city]);
+
+  useEffect(() => {
+    if (!city) return;
+    // The backend caches summaries and recomputes them when a CSV changes,
+    // so refetching on each run is cheap and picks up file updates
+    let cancelled = false;
+    fetchDataSummary(city)
+      .then((s) => {
+        if (!cancelled) setSummary(s);
+      })
+      .catch((err) => {
+        console.error('Failed to load data summary:', err);
+        if (!cancelled) setSummary(null);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [city, results]);
+
+  const sample = summary?.sample || (previewData?.sample as Record<string, unknown>[]) || [];
+  const columns = summary?.columns || (previewData?.columns as string[]) || [];
+  const rowCount = summary?.rows ?? (previewData?.rows as number | undefined);
 
   const onMouseDown = useCallback((e: React.MouseEvent) => {
     e.preventDefault();
@@ -53,10 +99,13 @@ export default function DataPreviewPanel() {
 
       {/* Header */}
       <div className="flex items-center justify-between px-4 py-1.5 border-b border-gray-800 flex-shrink-0">
-        <span className="text-xs font-semibold text-gray-400">Data Preview</span>
-        {previewData && (
+        <span className="text-xs font-semibold text-gray-400">
+          Data Preview{summary ? ` — ${summary.city}` : ''}
+        </span>
+        {rowCount != null && (
           <span className="text-[10px] text-gray-500">
-            {previewData.rows as number} rows | {(previewData.columns as string[]).length} columns
+            {rowCount} rows | {columns.length} columns
+            {summary && ` | ${summary.date_range.start} to ${summary.date_range.end}`}
           </span>
         )}
       </div>
@@ -68,6 +117,46 @@ export default function DataPreviewPanel() {
             Run the pipeline to preview data
           </div>
         ) : (
+          <>
+          {summary && (
+            <div className="flex gap-4 px-3 py-2 border-b border-gray-800">
+              <table className="text-xs">
+                <thead>
+                  <tr className="text-gray-400">
+                    {['column', 'min', 'max', 'mean', 'nulls', 'distribution'].map((h) => (
+                      <th key={h} className="px-2 py-1 text-left font-medium">{h}</th>
+                    ))}
+                  </tr>
+                </thead>
+                <tbody>
+                  {Object.entries(summary.stats).map(([col, st]) => (
+                    <tr key={col} className="text-gray-300 font-mono">
+                      <td className="px-2 py-0.5 text-gray-400">{col}</td>
+                      <td className="px-2 py-0.5">{st.min ?? '—'}</td>
+                      <td className="px-2 py-0.5">{st.max ?? '—'}</td>
+                      <td className="px-2 py-0.5">{st.mean ?? '—'}</td>
+                      <td className="px-2 py-0.5">{st.nulls}</td>
+                      <td className="px-2 py-0.5">{st.histogram && <Histogram counts={st.histogram.counts} />}</td>
+                    </tr>
+                  ))}
+                </tbody>
+              </table>
+              <div className="flex-1 min-w-[200px]" style={{ height: 180 }}>
+                <ResponsiveContainer width="100%" height="100%">
+                  <LineChart data={summary.overview}>
+                    <XAxis dataKey="date" tick={{ fontSize: 10, fill: '#9ca3af' }} />
+                    <YAxis tick={{ fontSize: 10, fill: '#9ca3af' }} />
+                    <Tooltip
+                      contentStyle={{ background: '#1f2937', border: '1px solid #374151', borderRadius: 8 }}
+                      labelStyle={{ color: '#9ca3af' }}
+                    />
+                    <Line type="monotone" dataKey="temp_max" stroke="#f59e0b" dot={false} strokeWidth={1.5} />
+                    <Line type="monotone" dataKey="temp_min" stroke="#3b82f6" dot={false} strokeWidth={1.5} />
+                  </LineChart>
+                </ResponsiveContainer>
+              </div>
+            </div>
+          )}
           <table className="w-full text-xs">
             <thead className="sticky top-0 bg-gray-800">
               <tr>
@@ -90,6 +179,7 @@ export default function DataPreviewPanel() {
               ))}
             </tbody>
           </table>
+          </>
         )}
       </div>
     </div>
@@ -19,6 +19,10 @@ const METRIC_DESCRIPTIONS: Record<string, string> = {
   train_rmse: "Root Mean Squared Error on the training set, in the same units as the target variable (degrees). XGBoost's RMSE on training data is usually suspiciously low because gradient boosting is very good at fitting training data — this is the metric's way of saying 'I memorized everything you showed me.' The test RMSE is more informative.",
   test_rmse: "Root Mean Squared Error on held-out test data. This is the headline number — on average, how many degrees off is each prediction? An RMSE of 3.0 means the model's predictions are typically about 3 degrees wrong. Whether that's good depends on your standards; weather forecasters would call it decent for a statistical model, though they'd also note they have radar and satellites.",
   test_mae: "Mean Absolute Error on test data. Like RMSE but without squaring, so it's less punishing of occasional big misses. If MAE is much lower than RMSE, it means the model usually does well but occasionally faceplants spectacularly. If they're similar, the errors are consistent. MAE is what you'd quote if someone asked 'how far off is it, usually?'",
+  anomaly_threshold: "The reconstruction error above which a day gets flagged. It's set at a quantile of the training errors, so at 0.99 roughly one training day in a hundred would count as anomalous by construction. Days that the autoencoder can't recreate well are either broken sensor readings or weather that genuinely doesn't look like the rest of the history.",
+  train_anomalies: "How many training days exceed the threshold. This is mostly a sanity check — it should be close to (1 - quantile) times the number of training days, because that's how the threshold was chosen.",
+  test_anomalies: "How many test days exceed the threshold. If this is much higher than the train rate, either the test period had unusual weather or the data drifted in a way the autoencoder never learned about.",
+  oof_rmse: "RMSE of out-of-fold predictions on the training set: each training day is predicted by a model that never saw it. Unlike train_rmse this isn't flattered by memorization, which is why the Ensemble node learns its blend weights from these predictions rather than the in-sample ones.",
   test_r2: "R-squared, the proportion of variance explained. 1.0 means perfect predictions, 0.0 means the model is no better than just guessing the average every time. 0.85 is quite good for weather prediction from historical data alone — it means the model explains 85% of why temperatures vary from day to day. The remaining 15% is weather being weather.",
 };
 
@@ -54,12 +58,17 @@ export default function ResultsPanel() {
           <h4 className="text-xs font-semibold text-gray-300 mb-2">
             {nodeId} — {data.node_type ?? ''}
           </h4>
+          {!!data.fingerprint && (
+            <div className="mb-2 text-[10px] text-gray-500 font-mono" title="Content hash of this node's outputs">
+              fingerprint {data.fingerprint}
+            </div>
+          )}
 
           {/* Metrics */}
           {!!data.metrics && (
             <div className="space-y-1.5">
               {Object.entries(data.metrics).map(([key, val]) => {
-                if (key === 'chart_data' || key === 'loss_curve') return null;
+                if (['chart_data', 'loss_curve', 'anomalies', 'city_anomaly_counts'].includes(key)) return null;
                 const desc = METRIC_DESCRIPTIONS[key];
                 const isExpanded = expandedMetric === `${nodeId}.${key}`;
                 return (
@@ -113,6 +122,42 @@ export default function ResultsPanel() {
             </div>
           )}
 
+          {/* Anomaly detection flagged days */}
+          {!!data.metrics?.anomalies && (
+            <div className="mt-3 text-xs">
+              {!!data.metrics.city_anomaly_counts && (
+                <div className="mb-2 text-gray-400 space-y-0.5">
+                  {Object.entries(data.metrics.city_anomaly_counts as Record<string, number>).map(([city, n]) => (
+                    <div key={city} className="flex justify-between">
+                      <span>{city}</span>
+                      <span className="text-white font-mono">{n}</span>
+                    </div>
+                  ))}
+                </div>
+              )}
+              <div className="max-h-48 overflow-y-auto">
+                <table className="w-full">
+                  <thead className="text-gray-400">
+                    <tr>
+                      <th className="text-left font-medium">date</th>
+                      {!!data.metrics.city_anomaly_counts && <th className="text-left font-medium">city</th>}
+                      <th className="text-right font-medium">score</th>
+                    </tr>
+                  </thead>
+                  <tbody>
+                    {(data.metrics.anomalies as { date: string; city?: string; score: number }[]).map((a, i) => (
+                      <tr key={i} className="border-t border-gray-700 text-gray-300 font-mono">
+                        <td>{a.date}</td>
+                        {!!data.metrics?.city_anomaly_counts && <td>{a.city}</td>}
+                        <td className="text-right">{a.score}</td>
+                      </tr>
+                    ))}
+                  </tbody>
+                </table>
+              </div>
+            </div>
+          )}
+
           {/* Autoencoder loss curve */}
           {!!data.metrics?.loss_curve && (
             <div className="mt-3" style={{ height: 150 }}>
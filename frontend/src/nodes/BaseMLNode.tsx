@@ -17,7 +17,11 @@ export default function BaseMLNode({ id, data, selected }: NodeProps) {
     label: string;
     nodeType: string;
     params: Record<string, unknown>;
-    meta?: { category: string; input_ports: { name: string }[]; output_ports: { name: string }[] };
+    meta?: {
+      category: string;
+      input_ports: { name: string; multiple?: boolean }[];
+      output_ports: { name: string }[];
+    };
   };
 
   const category = nodeData.meta?.category || 'data';
@@ -80,11 +84,14 @@ export default function BaseMLNode({ id, data, selected }: NodeProps) {
           type="target"
           position={Position.Left}
           id={port.name}
+          title={port.multiple ? 'Accepts several inputs' : undefined}
           style={{
             top: `${30 + i * 20}px`,
             background: '#94a3b8',
+            // Ports that collect several edges are drawn taller and squarer
             width: 10,
-            height: 10,
+            height: port.multiple ? 18 : 10,
+            borderRadius: port.multiple ? 3 : undefined,
             border: '2px solid #1e1e2e',
           }}
         />
@@ -33,6 +33,7 @@ interface PipelineState {
   isRunning: boolean;
   dataPreviewHeight: number;
   sidePanelWidth: number;
+  seed: number | null;
 
   onNodesChange: OnNodesChange;
   onEdgesChange: OnEdgesChange;
@@ -45,6 +46,7 @@ interface PipelineState {
   addNode: (type: string, position: { x: number; y: number }) => void;
   setDataPreviewHeight: (h: number) => void;
   setSidePanelWidth: (w: number) => void;
+  setSeed: (seed: number | null) => void;
 }
 
 let nextId = 10;
@@ -91,6 +93,7 @@ export const usePipelineStore = create<PipelineState>((set, get) => ({
   isRunning: false,
   dataPreviewHeight: 25,
   sidePanelWidth: 340,
+  seed: null,
 
   onNodesChange: (changes) => {
     set({ nodes: applyNodeChanges(changes, get().nodes) as PipelineNode[] });
@@ -125,7 +128,7 @@ export const usePipelineStore = create<PipelineState>((set, get) => ({
   run: async (targetNode?: string) => {
     set({ isRunning: true, results: null });
     try {
-      const { nodes, edges } = get();
+      const { nodes, edges, seed } = get();
       const payload = nodes.map((n) => ({
         id: n.id,
         type: n.data.nodeType,
@@ -137,7 +140,7 @@ export const usePipelineStore = create<PipelineState>((set, get) => ({
         target: e.target,
         targetHandle: e.targetHandle || 'input',
       }));
-      const result = await runPipeline(payload, edgePayload, targetNode);
+      const result = await runPipeline(payload, edgePayload, targetNode, seed);
       set({ results: result });
     } catch (err) {
       console.error('Pipeline run failed:', err);
@@ -166,4 +169,5 @@ export const usePipelineStore = create<PipelineState>((set, get) => ({
   },
   setDataPreviewHeight: (h) => set({ dataPreviewHeight: Math.max(10, Math.min(50, h)) }),
   setSidePanelWidth: (w) => set({ sidePanelWidth: Math.max(280, Math.min(800, w)) }),
+  setSeed: (seed) => set({ seed }),
 }));
@@ -6,7 +6,8 @@ export default defineConfig({
   plugins: [react(), tailwindcss()],
   server: {
     proxy: {
-      '/api': 'http://localhost:8000',
+      // xfwd adds X-Forwarded-For so the backend sees real client addresses
+      '/api': { target: 'http://localhost:8000', xfwd: true },
     },
   },
 })